@@ -1,8 +1,50 @@
+import os
+import sys
+import traceback
 from tkinter import messagebox
+from typing import Callable, Optional
 
+# Optional hook used by the UI so dialogs raised from worker threads are
+# shown on the Tk main thread.  ``None`` means "show directly".
+_dispatcher: Optional[Callable[[Callable[[], None]], None]] = None
 
-def human_error(msg: str, details: str = "") -> None:
-    """Show a concise error dialog and print details to console."""
-    if details:
-        print(details)
-    messagebox.showerror("Error", msg)
+# When set (by the CLI), errors go to stderr instead of a Tk dialog.
+_console = False
+
+# True once any error has been reported; the CLI turns it into exit code 1.
+_had_error = False
+
+
+def set_dispatcher(dispatcher: Optional[Callable[[Callable[[], None]], None]]) -> None:
+    """Route error dialogs through *dispatcher* (e.g. ``root.after``)."""
+    global _dispatcher
+    _dispatcher = dispatcher
+
+
+def use_console() -> None:
+    """Report errors on stderr; used when no Tk root exists (CLI mode)."""
+    global _console
+    _console = True
+
+
+def had_error() -> bool:
+    """Return whether human_error has been called this run."""
+    return _had_error
+
+
+def human_error(msg: str, exc: Optional[BaseException] = None) -> None:
+    """Show a concise error dialog; print the traceback when debugging.
+
+    The traceback for *exc* is only formatted when PDFTOOL_DEBUG is set,
+    so ordinary failure paths skip the stack walk entirely.
+    """
+    global _had_error
+    _had_error = True
+    if exc is not None and os.environ.get("PDFTOOL_DEBUG"):
+        traceback.print_exception(type(exc), exc, exc.__traceback__)
+    if _console:
+        print(f"Error: {msg}", file=sys.stderr)
+    elif _dispatcher is not None:
+        _dispatcher(lambda: messagebox.showerror("Error", msg))
+    else:
+        messagebox.showerror("Error", msg)
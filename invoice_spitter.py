@@ -1,11 +1,71 @@
-"""Compatibility entry point for launching the Tkinter UI."""
+"""Entry point for the PDF tools.
 
-from ui import PdfApp
+Without arguments this launches the Tkinter UI.  With arguments it runs a
+headless CLI suitable for batch jobs and scripts, bypassing Tk entirely:
+
+```
+python invoice_spitter.py split input.pdf out_dir
+python invoice_spitter.py split-chosen input.pdf out_dir "1-3; 4,7"
+python invoice_spitter.py merge a.pdf b.pdf -o merged.pdf
+```
+"""
+
+import sys
+
+
+def cli_main(argv) -> int:
+    """Run a split/merge operation from the command line, without Tk.
+
+    Returns the process exit code: 1 if any error was reported, else 0.
+    """
+    import argparse
+
+    from error_handler import had_error, use_console
+    from merger import PdfMerger
+    from splitter import PdfSplitter
+
+    use_console()
+    parser = argparse.ArgumentParser(
+        prog="invoice_spitter", description="Split or merge PDF files."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_split = sub.add_parser("split", help="split a PDF into one file per page")
+    p_split.add_argument("pdf", help="input PDF file")
+    p_split.add_argument("out_dir", help="output folder")
+
+    p_chosen = sub.add_parser("split-chosen", help="split selected page groups")
+    p_chosen.add_argument("pdf", help="input PDF file")
+    p_chosen.add_argument("out_dir", help="output folder")
+    p_chosen.add_argument("pages", help="page selections, e.g. '1-3; 4,7'")
+
+    p_merge = sub.add_parser("merge", help="merge PDFs into one document")
+    p_merge.add_argument("inputs", nargs="+", help="PDF files to merge")
+    p_merge.add_argument("-o", "--output", required=True, help="output PDF file")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "split":
+        splitter = PdfSplitter(print)
+        splitter.split(args.pdf, args.out_dir)
+    elif args.command == "split-chosen":
+        splitter = PdfSplitter(print)
+        splitter.split_chosen_pages(args.pdf, args.out_dir, args.pages)
+    else:
+        merger = PdfMerger(print)
+        merger.merge(args.inputs, args.output)
+    return 1 if had_error() else 0
 
 
 def main() -> None:
-    app = PdfApp()
-    app.mainloop()
+    if len(sys.argv) > 1:
+        sys.exit(cli_main(sys.argv[1:]))
+    else:
+        # Imported lazily so CLI runs never pay for Tk widget setup.
+        from ui import PdfApp
+
+        app = PdfApp()
+        app.mainloop()
 
 
 if __name__ == "__main__":
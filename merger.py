@@ -1,14 +1,15 @@
 import os
-import traceback
-from typing import Callable, Optional
-
-try:
-    from pypdf import PdfReader, PdfWriter
-except Exception:
-    print("Missing dependency 'pypdf'. Install with: pip install pypdf")
-    raise
+import threading
+import time
+from typing import Callable, Optional, Sequence, Union
 
 from error_handler import human_error
+from pdf_io import get_fitz, open_document
+
+# Above this combined input size the merged document is saved straight to
+# disk by MuPDF instead of being serialized into a Python bytes object,
+# keeping peak memory at roughly one copy of the data instead of two.
+_DIRECT_SAVE_LIMIT = 256 * 1024 * 1024
 
 
 class PdfMerger:
@@ -21,52 +22,84 @@ class PdfMerger:
     ) -> None:
         self.status_callback = status_callback
         self.progress_callback = progress_callback
+        self._last_progress = 0.0
+        # Set by the UI so a running job can be aborted between files.
+        self.cancel_event: Optional[threading.Event] = None
 
     def _status(self, msg: str) -> None:
         if self.status_callback:
             self.status_callback(msg)
 
     def _progress(self, current: int, total: int) -> None:
+        # Coalesce to one callback per ~50 ms; the final tick always fires.
         if self.progress_callback:
+            now = time.monotonic()
+            if current != total and now - self._last_progress < 0.05:
+                return
+            self._last_progress = now
             self.progress_callback(current, total)
 
-    def merge(self, paths_str: str, out_path: str) -> None:
-        """Merge the PDF files in *paths_str* into *out_path*."""
-        if not paths_str:
+    def _cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def merge(self, paths: Union[str, Sequence[str]], out_path: str) -> None:
+        """Merge the PDF files in *paths* into *out_path*.
+
+        *paths* is a sequence of file paths; a ``;``-separated string is
+        still accepted for backwards compatibility.
+        """
+        if isinstance(paths, str):
+            paths = [p.strip() for p in paths.split(";")]
+        paths = [p for p in paths if p]
+        if not paths:
             human_error("Please select PDF files to merge.")
             return
-        paths = [p.strip() for p in paths_str.split(";") if p.strip()]
         if not out_path:
             human_error("Please choose an output file.")
             return
+        # Validate all inputs in one pass so a missing file aborts before
+        # any parsing work starts; the sizes also decide the save strategy.
+        total_bytes = 0
+        for path in paths:
+            try:
+                total_bytes += os.stat(path).st_size
+            except OSError:
+                human_error(f"File not found: {path}")
+                return
         try:
-            writer = PdfWriter()
+            out = get_fitz().open()
             total = len(paths)
+            insert = out.insert_pdf
+            if self.cancel_event is not None:
+                self.cancel_event.clear()
             for idx, path in enumerate(paths, start=1):
-                if not os.path.isfile(path):
+                if self._cancelled():
+                    self._status("Cancelled.")
+                    return
+                try:
+                    src = open_document(path)
+                except FileNotFoundError:
                     human_error(f"File not found: {path}")
                     return
-                reader = PdfReader(path)
-                if getattr(reader, "is_encrypted", False):
-                    try:
-                        ok = reader.decrypt("")
-                        if ok == 0:
-                            human_error("One of the PDFs is password-protected. Decryption failed.")
-                            return
-                    except Exception:
-                        human_error("One of the PDFs is password-protected. Decryption failed.")
-                        return
-                for page in reader.pages:
-                    writer.add_page(page)
+                if src.needs_pass and not src.authenticate(""):
+                    human_error("One of the PDFs is password-protected. Decryption failed.")
+                    return
+                insert(src)
+                src.close()
                 self._status(f"Processed {idx}/{total} files...")
                 self._progress(idx, total)
-            with open(out_path, "wb") as f:
-                writer.write(f)
+            if total_bytes > _DIRECT_SAVE_LIMIT:
+                out.save(out_path, garbage=0, deflate=False)
+            else:
+                buf = out.tobytes(garbage=0, deflate=False)
+                with open(out_path, "wb") as f:
+                    f.write(buf)
+            out.close()
             self._status(f"Done. Wrote merged PDF to:\n{out_path}")
             try:
                 os.startfile(out_path)  # type: ignore[attr-defined]
             except Exception:
                 pass
-        except Exception:
-            human_error("An unexpected error occurred while merging.", traceback.format_exc())
+        except Exception as e:
+            human_error("An unexpected error occurred while merging.", e)
             self._status("")
@@ -1,29 +1,115 @@
-from typing import List
+from typing import List, Optional, Tuple
 
+try:  # Optional fast path for very large selections
+    import numpy as np
+except Exception:
+    np = None
 
-def parse_page_selection(selection: str, total_pages: int) -> List[int]:
-    """Convert a page selection like '1-3,5' into a list of page numbers."""
-    pages: List[int] = []
+# Below this many selected pages the numba call (and its first-use JIT
+# compile) costs more than the pure-Python loop it replaces.
+_JIT_THRESHOLD = 4096
+
+# Compiled bitmap filler; created on first large selection so the
+# multi-hundred-ms numba import is never paid up front.
+_fill_bitmap = None
+
+
+def _get_fill_bitmap():
+    global _fill_bitmap
+    if _fill_bitmap is None:
+        from numba import njit
+
+        @njit(cache=True)
+        def fill(starts, ends, bitmap):  # pragma: no cover - compiled
+            for i in range(starts.shape[0]):
+                for p in range(starts[i], ends[i] + 1):
+                    bitmap[p >> 3] |= 1 << (p & 7)
+
+        _fill_bitmap = fill
+    return _fill_bitmap
+
+
+def _scan_token(part: str) -> Optional[Tuple[int, Optional[int]]]:
+    """Scan ``N`` or ``N-M`` in one pass; returns ``None`` when malformed."""
+    i, n = 0, len(part)
+    start = 0
+    digits = 0
+    while i < n and "0" <= part[i] <= "9":
+        start = start * 10 + (ord(part[i]) - 48)
+        i += 1
+        digits += 1
+    if digits == 0:
+        return None
+    while i < n and part[i].isspace():
+        i += 1
+    if i == n:
+        return start, None
+    if part[i] != "-":
+        return None
+    i += 1
+    while i < n and part[i].isspace():
+        i += 1
+    end = 0
+    digits = 0
+    while i < n and "0" <= part[i] <= "9":
+        end = end * 10 + (ord(part[i]) - 48)
+        i += 1
+        digits += 1
+    if digits == 0 or i != n:
+        return None
+    return start, end
+
+
+def parse_page_selection(selection: str, total_pages: int):
+    """Convert a page selection like '1-3,5' into sorted page numbers.
+
+    Duplicate pages are collapsed via a bitmap over ``1..total_pages``, so the
+    result is deduplicated and ascending regardless of input order.  With
+    numpy installed the result is a flat ``int32`` array (a quarter of the
+    memory of a list of Python ints for big ranges); otherwise a plain list.
+    """
+    starts: List[int] = []
+    ends: List[int] = []
     for part in selection.split(","):
         part = part.strip()
         if not part:
             continue
-        if "-" in part:
-            start_s, end_s = part.split("-", 1)
-            try:
-                start = int(start_s)
-                end = int(end_s)
-            except ValueError:
+        token = _scan_token(part)
+        if token is None:
+            if "-" in part:
                 raise ValueError(f"Invalid range: {part}")
-            if not (1 <= start <= end <= total_pages):
-                raise ValueError(f"Page range out of bounds: {part}")
-            pages.extend(range(start, end + 1))
-        else:
-            try:
-                page = int(part)
-            except ValueError:
-                raise ValueError(f"Invalid page number: {part}")
-            if not (1 <= page <= total_pages):
+            raise ValueError(f"Invalid page number: {part}")
+        start, end = token
+        if end is None:
+            if not (1 <= start <= total_pages):
                 raise ValueError(f"Page out of bounds: {part}")
-            pages.append(page)
-    return pages
+            end = start
+        elif not (1 <= start <= end <= total_pages):
+            raise ValueError(f"Page range out of bounds: {part}")
+        starts.append(start)
+        ends.append(end)
+    span = sum(e - s + 1 for s, e in zip(starts, ends))
+    fill = None
+    if np is not None and span >= _JIT_THRESHOLD:
+        try:
+            fill = _get_fill_bitmap()
+        except Exception:
+            fill = None
+    if fill is not None:
+        bitmap = np.zeros((total_pages + 8) >> 3, dtype=np.uint8)
+        fill(
+            np.asarray(starts, dtype=np.int32),
+            np.asarray(ends, dtype=np.int32),
+            bitmap,
+        )
+    else:
+        bitmap = bytearray((total_pages + 8) >> 3)
+        for start, end in zip(starts, ends):
+            for p in range(start, end + 1):
+                bitmap[p >> 3] |= 1 << (p & 7)
+    if np is not None:
+        # Bit index == page number, so expanding the bitmap and taking the
+        # set positions yields the sorted pages without a Python loop.
+        bits = np.unpackbits(np.frombuffer(bytes(bitmap), dtype=np.uint8), bitorder="little")
+        return np.flatnonzero(bits).astype(np.int32)
+    return [p for p in range(1, total_pages + 1) if bitmap[p >> 3] & (1 << (p & 7))]
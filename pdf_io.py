@@ -0,0 +1,54 @@
+"""Shared helpers for opening PDF documents with a small reuse cache."""
+
+import os
+from functools import lru_cache
+
+# PyMuPDF's package import is heavy; defer it so GUI startup (and code
+# paths that never touch a PDF) don't pay for it.
+_fitz = None
+
+
+def get_fitz():
+    """Import PyMuPDF on first use and cache the module object."""
+    global _fitz
+    if _fitz is None:
+        try:
+            import fitz  # PyMuPDF
+        except Exception:
+            print("Missing dependency 'PyMuPDF'. Install with: pip install PyMuPDF")
+            raise
+        _fitz = fitz
+    return _fitz
+
+# Files larger than this bypass the cache; keeping multi-hundred-MB scans
+# alive in RAM across operations would cost more than the reparse saves.
+_CACHE_BYTE_LIMIT = 64 * 1024 * 1024
+
+
+@lru_cache(maxsize=32)
+def _read_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+def open_document(path: str):
+    """Open *path* with fitz, serving repeated opens from a byte cache.
+
+    The cache key includes mtime and size, so editing a file on disk
+    invalidates its stale entry. Repeated split/merge runs on the same
+    inputs within a session skip the disk read entirely.
+    """
+    fitz = get_fitz()
+    st = os.stat(path)
+    if st.st_size > _CACHE_BYTE_LIMIT:
+        # Open big files by path instead of reading them into memory:
+        # MuPDF seeks through the file itself, so only the pages actually
+        # touched are ever faulted in by the OS.
+        return fitz.open(path)
+    data = _read_bytes(path, st.st_mtime_ns, st.st_size)
+    return fitz.open(stream=data, filetype="pdf")
+
+
+def clear_document_cache() -> None:
+    """Drop all cached file contents (wired to the UI clear buttons)."""
+    _read_bytes.cache_clear()
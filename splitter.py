@@ -1,15 +1,50 @@
 import os
-import traceback
-from typing import List, Callable, Optional
-
-try:
-    from pypdf import PdfReader, PdfWriter
-except Exception:
-    print("Missing dependency 'pypdf'. Install with: pip install pypdf")
-    raise
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
 
 from error_handler import human_error
 from page_selection import parse_page_selection
+from pdf_io import get_fitz, open_document
+
+
+def _write_page_range(
+    pdf_path: str, start: int, end: int, out_path: str, compress: bool = False
+) -> int:
+    """Write pages *start*..*end* (1-based, inclusive) of *pdf_path* to *out_path*.
+
+    Runs inside worker processes.  The source is opened by path so MuPDF
+    pages it in on demand; workers then share the file through the OS
+    page cache instead of each reading the whole PDF up front.
+    """
+    fitz = get_fitz()
+    src = fitz.open(pdf_path)
+    try:
+        if src.needs_pass:
+            src.authenticate("")
+        dst = fitz.open()
+        dst.insert_pdf(src, from_page=start - 1, to_page=end - 1)
+        # Pages are copied verbatim: keep clean=False and deflate
+        # off (unless explicitly requested) so content streams and
+        # scanned images are never decoded and re-encoded here.
+        buf = dst.tobytes(garbage=0, deflate=compress, clean=False)
+        with open(out_path, "wb") as f:
+            f.write(buf)
+        dst.close()
+    finally:
+        src.close()
+    return start
+
+
+def _write_task(task) -> int:
+    """Unpack one split task; lets the process pool map over task tuples."""
+    return _write_page_range(*task)
+
+
+# Jobs below this many output files run serially: spawning worker
+# processes costs more than the writes themselves.
+_PARALLEL_THRESHOLD = 8
 
 
 class PdfSplitter:
@@ -19,20 +54,41 @@ class PdfSplitter:
         self,
         status_callback: Optional[Callable[[str], None]] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        compress: bool = False,
     ) -> None:
         self.status_callback = status_callback
         self.progress_callback = progress_callback
+        # Re-deflating streams that are copied verbatim is usually the most
+        # expensive part of serialization; off by default at the cost of
+        # somewhat larger output files.
+        self.compress = compress
+        self._last_progress = 0.0
+        # Set by the UI so a running job can be aborted between writes.
+        self.cancel_event: Optional[threading.Event] = None
 
     def _status(self, msg: str) -> None:
         if self.status_callback:
             self.status_callback(msg)
 
     def _progress(self, current: int, total: int) -> None:
+        # Coalesce to one callback per ~50 ms; the final tick always fires.
         if self.progress_callback:
+            now = time.monotonic()
+            if current != total and now - self._last_progress < 0.05:
+                return
+            self._last_progress = now
             self.progress_callback(current, total)
 
-    def split(self, pdf_path: str, out_dir: str) -> None:
-        """Split each page of *pdf_path* into separate files inside *out_dir*."""
+    def _cancelled(self) -> bool:
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def split(self, pdf_path: str, out_dir: str, pages_per_file: int = 1) -> None:
+        """Split *pdf_path* into files of *pages_per_file* pages inside *out_dir*.
+
+        The default of one page per file preserves the classic behaviour;
+        larger batches amortize per-file open/serialize overhead by that
+        factor and name outputs ``{base}_p{start:03d}-{end:03d}.pdf``.
+        """
         if not pdf_path:
             human_error("Please select a PDF file first.")
             return
@@ -44,42 +100,68 @@ class PdfSplitter:
             return
         try:
             os.makedirs(out_dir, exist_ok=True)
-        except Exception:
-            human_error("Cannot create the output folder.", traceback.format_exc())
+        except Exception as e:
+            human_error("Cannot create the output folder.", e)
             return
         try:
             self._status("Reading PDF...")
-            reader = PdfReader(pdf_path)
-            if getattr(reader, "is_encrypted", False):
-                try:
-                    ok = reader.decrypt("")
-                    if ok == 0:
-                        human_error("This PDF appears to be password-protected. Decryption failed.")
-                        return
-                except Exception:
-                    human_error("This PDF appears to be password-protected. Decryption failed.")
-                    return
-            total_pages = len(reader.pages)
+            src = open_document(pdf_path)
+            if src.needs_pass and not src.authenticate(""):
+                human_error("This PDF appears to be password-protected. Decryption failed.")
+                return
+            total_pages = src.page_count
             if total_pages == 0:
                 human_error("No pages found in the PDF.")
                 return
             base = os.path.splitext(os.path.basename(pdf_path))[0]
-            for idx, page in enumerate(reader.pages, start=1):
-                writer = PdfWriter()
-                writer.add_page(page)
-                out_name = f"{base}_p{idx:03d}.pdf"
-                out_path = os.path.join(out_dir, out_name)
-                with open(out_path, "wb") as f:
-                    writer.write(f)
-                self._status(f"Writing page {idx}/{total_pages}...")
-                self._progress(idx, total_pages)
-            self._status(f"Done. Wrote {total_pages} files to:\n{out_dir}")
+            src.close()
+            # One join up front; per-page paths are then a single f-string.
+            prefix = os.path.join(out_dir, base) + "_p"
+            batch = max(1, pages_per_file)
+            tasks = []
+            if batch == 1:
+                for idx in range(1, total_pages + 1):
+                    tasks.append((pdf_path, idx, idx, f"{prefix}{idx:03d}.pdf", self.compress))
+            else:
+                for start in range(1, total_pages + 1, batch):
+                    end = min(start + batch - 1, total_pages)
+                    tasks.append(
+                        (pdf_path, start, end, f"{prefix}{start:03d}-{end:03d}.pdf", self.compress)
+                    )
+            total_files = len(tasks)
+            unit = "page" if batch == 1 else "file"
+            if self.cancel_event is not None:
+                self.cancel_event.clear()
+            if total_files < _PARALLEL_THRESHOLD:
+                for done, task in enumerate(tasks, start=1):
+                    if self._cancelled():
+                        self._status("Cancelled.")
+                        return
+                    _write_task(task)
+                    self._status(f"Writing {unit} {done}/{total_files}...")
+                    self._progress(done, total_files)
+            else:
+                workers = min(os.cpu_count() or 1, 8)
+                pool = ProcessPoolExecutor(max_workers=workers)
+                try:
+                    # chunksize batches ~10 tasks per IPC round trip.
+                    for done, _ in enumerate(
+                        pool.map(_write_task, tasks, chunksize=10), start=1
+                    ):
+                        if self._cancelled():
+                            self._status("Cancelled.")
+                            return
+                        self._status(f"Writing {unit} {done}/{total_files}...")
+                        self._progress(done, total_files)
+                finally:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            self._status(f"Done. Wrote {total_files} files to:\n{out_dir}")
             try:
                 os.startfile(out_dir)  # type: ignore[attr-defined]
             except Exception:
                 pass
-        except Exception:
-            human_error("An unexpected error occurred while splitting.", traceback.format_exc())
+        except Exception as e:
+            human_error("An unexpected error occurred while splitting.", e)
             self._status("")
 
     def split_chosen_pages(self, pdf_path: str, out_dir: str, pages_spec: str) -> None:
@@ -102,37 +184,54 @@ class PdfSplitter:
             return
         try:
             os.makedirs(out_dir, exist_ok=True)
-        except Exception:
-            human_error("Cannot create the output folder.", traceback.format_exc())
+        except Exception as e:
+            human_error("Cannot create the output folder.", e)
             return
         try:
             self._status("Reading PDF...")
-            reader = PdfReader(pdf_path)
-            if getattr(reader, "is_encrypted", False):
-                try:
-                    ok = reader.decrypt("")
-                    if ok == 0:
-                        human_error("This PDF appears to be password-protected. Decryption failed.")
-                        return
-                except Exception:
-                    human_error("This PDF appears to be password-protected. Decryption failed.")
-                    return
-            total_pages = len(reader.pages)
+            # open_document serves every per-group copy below from one
+            # cached read instead of going back to disk.
+            src = open_document(pdf_path)
+            if src.needs_pass and not src.authenticate(""):
+                human_error("This PDF appears to be password-protected. Decryption failed.")
+                return
+            total_pages = src.page_count
             base = os.path.splitext(os.path.basename(pdf_path))[0]
             total_groups = len(groups)
-            for idx, group in enumerate(groups, start=1):
-                try:
-                    page_numbers = parse_page_selection(group, total_pages)
-                except ValueError as e:
-                    human_error(str(e))
+            # Parse every selection before writing anything, so a bad group
+            # aborts the run without leaving partial output behind.  A group
+            # of only empty tokens (e.g. ",") parses to nothing and would
+            # make Document.select raise mid-run, so it is rejected here too.
+            parsed_groups = []
+            try:
+                for g in groups:
+                    page_numbers = parse_page_selection(g, total_pages)
+                    if len(page_numbers) == 0:
+                        human_error(f"Invalid page selection: {g}")
+                        return
+                    parsed_groups.append(page_numbers)
+            except ValueError as e:
+                human_error(str(e))
+                return
+            src.close()
+            prefix = os.path.join(out_dir, base) + "_sel"
+            if self.cancel_event is not None:
+                self.cancel_event.clear()
+            for idx, page_numbers in enumerate(parsed_groups, start=1):
+                if self._cancelled():
+                    self._status("Cancelled.")
                     return
-                writer = PdfWriter()
-                for p in page_numbers:
-                    writer.add_page(reader.pages[p - 1])
-                out_name = f"{base}_sel{idx:02d}.pdf"
-                out_path = os.path.join(out_dir, out_name)
+                dst = open_document(pdf_path)
+                if dst.needs_pass:
+                    dst.authenticate("")
+                # Page selection happens in C against the parsed xref table;
+                # garbage=3 drops the objects the selection no longer uses.
+                dst.select([int(p) - 1 for p in page_numbers])
+                out_path = f"{prefix}{idx:02d}.pdf"
+                buf = dst.tobytes(garbage=3, deflate=self.compress)
                 with open(out_path, "wb") as f:
-                    writer.write(f)
+                    f.write(buf)
+                dst.close()
                 self._status(f"Writing file {idx}/{total_groups}...")
                 self._progress(idx, total_groups)
             self._status(f"Done. Wrote {total_groups} files to:\n{out_dir}")
@@ -140,6 +239,6 @@ class PdfSplitter:
                 os.startfile(out_dir)  # type: ignore[attr-defined]
             except Exception:
                 pass
-        except Exception:
-            human_error("An unexpected error occurred while splitting.", traceback.format_exc())
+        except Exception as e:
+            human_error("An unexpected error occurred while splitting.", e)
             self._status("")
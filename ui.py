@@ -27,15 +27,23 @@ bar and status line at the bottom of the window.
 from __future__ import annotations
 
 import os
+import queue
+import threading
+import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import Tk, StringVar, filedialog, Canvas
 from tkinter import ttk
 import tkinter.font as tkfont
 
+from error_handler import set_dispatcher
+from pdf_io import clear_document_cache
 from splitter import PdfSplitter
 from merger import PdfMerger
 
 APP_TITLE = "PDF Toolkit"
 
+
 # GitHub Desktop inspired dark color scheme
 GITHUB_BG = "#1f2328"
 GITHUB_HEADER_BG = "#161b22"
@@ -45,23 +53,87 @@ GITHUB_PRIMARY = "#2f81f7"
 GITHUB_FG = "#f0f6fc"
 
 
-def _create_round_rect(canvas: Canvas, x1: int, y1: int, x2: int, y2: int, radius: int, **kwargs) -> int:
-    """Draw a rounded rectangle on *canvas* and return the created shape id."""
-    points = [
-        x1 + radius, y1,
-        x2 - radius, y1,
-        x2, y1,
-        x2, y1 + radius,
-        x2, y2 - radius,
-        x2, y2,
-        x2 - radius, y2,
-        x1 + radius, y2,
-        x1, y2,
-        x1, y2 - radius,
-        x1, y1 + radius,
-        x1, y1,
-    ]
-    return canvas.create_polygon(points, smooth=True, **kwargs)
+# Shared default font and its metrics.  Creating tkfont.Font and querying
+# measure/metrics are Tcl round-trips; a dozen widgets used to repeat them
+# at startup.  Built lazily because fonts need a Tk root to exist.
+_FONT = None
+_CHAR_W = 0
+_LINE_H = 0
+
+
+def _font_metrics():
+    global _FONT, _CHAR_W, _LINE_H
+    if _FONT is None:
+        _FONT = tkfont.Font()
+        _CHAR_W = _FONT.measure("0")
+        _LINE_H = _FONT.metrics("linespace")
+    return _FONT, _CHAR_W, _LINE_H
+
+
+@lru_cache(maxsize=64)
+def _round_rect_geometry(x1: int, y1: int, x2: int, y2: int, radius: int):
+    """Bounding boxes for the four corner arcs and two fill rectangles.
+
+    Many widgets share the same (width, height, radius), so the boxes are
+    memoized; resize storms then reuse tuples instead of reallocating.
+    """
+    d = 2 * radius
+    return (
+        (x1, y1, x1 + d, y1 + d),
+        (x2 - d, y1, x2, y1 + d),
+        (x1, y2 - d, x1 + d, y2),
+        (x2 - d, y2 - d, x2, y2),
+        (x1 + radius, y1, x2 - radius, y2),
+        (x1, y1 + radius, x2, y2 - radius),
+    )
+
+
+# start angle of each corner arc, in _round_rect_geometry order
+_ARC_STARTS = (90, 0, 180, 270)
+
+
+def _create_round_rect(canvas: Canvas, x1: int, y1: int, x2: int, y2: int, radius: int, *, fill: str, tag: str | tuple[str, ...] = "bg"):
+    """Draw a rounded rectangle on *canvas* and return its group tag.
+
+    Arcs and rectangles are plain Tk primitives; a smoothed polygon would
+    make Tk tessellate Bezier segments on every redraw instead.
+    """
+    boxes = _round_rect_geometry(x1, y1, x2, y2, radius)
+    for box, start in zip(boxes[:4], _ARC_STARTS):
+        canvas.create_arc(box, start=start, extent=90, style="pieslice", fill=fill, outline="", tags=tag)
+    for box in boxes[4:]:
+        canvas.create_rectangle(box, fill=fill, outline="", tags=tag)
+    return tag
+
+
+# Shared RoundedButton event handlers, registered once as class bindings
+# on the "RoundedButton" bindtag instead of three lambdas per widget.
+_button_bindings_installed = False
+
+
+def _rb_click(event) -> None:
+    widget = event.widget
+    if widget._enabled:
+        widget.command()
+
+
+def _rb_enter(event) -> None:
+    widget = event.widget
+    if widget._enabled:
+        widget.itemconfigure(widget.hover_rect, state="normal")
+
+
+def _rb_leave(event) -> None:
+    event.widget.itemconfigure(event.widget.hover_rect, state="hidden")
+
+
+def _install_button_bindings(widget) -> None:
+    global _button_bindings_installed
+    if not _button_bindings_installed:
+        _button_bindings_installed = True
+        widget.bind_class("RoundedButton", "<Button-1>", _rb_click)
+        widget.bind_class("RoundedButton", "<Enter>", _rb_enter)
+        widget.bind_class("RoundedButton", "<Leave>", _rb_leave)
 
 
 class RoundedButton(Canvas):
@@ -84,75 +156,30 @@ class RoundedButton(Canvas):
         self.bg = bg
         self.active_bg = active_bg
         self.radius = radius
-        font = tkfont.Font()
-        char_width = font.measure("0")
+        font, char_width, line_height = _font_metrics()
         w = (width or len(text)) * char_width + 20
-        h = font.metrics("linespace") + 10
+        h = line_height + 10
         self.configure(width=w, height=h)
-        self.rect = _create_round_rect(self, 0, 0, w, h, radius, fill=bg, outline="")
+        # Size is fixed above; stop the geometry managers from re-measuring
+        # the canvas against its (non-existent) children.
+        self.grid_propagate(False)
+        self.pack_propagate(False)
+        self.rect = _create_round_rect(self, 0, 0, w, h, radius, fill=bg)
+        # The hover shape exists up front and is merely shown/hidden, so
+        # pointer moves never parse colors or touch item fills.
+        self.hover_rect = _create_round_rect(self, 0, 0, w, h, radius, fill=active_bg, tag="hover")
+        self.itemconfigure(self.hover_rect, state="hidden")
         self.create_text(w / 2, h / 2, text=text, fill=fg, font=font)
-        self.bind("<Button-1>", lambda e: self.command())
-        self.bind("<Enter>", lambda e: self.itemconfig(self.rect, fill=self.active_bg))
-        self.bind("<Leave>", lambda e: self.itemconfig(self.rect, fill=self.bg))
-
-
-class RoundedEntry(ttk.Frame):
-    """Entry widget with a rounded background."""
+        self._enabled = True
+        self.bindtags(("RoundedButton",) + self.bindtags())
+        _install_button_bindings(self)
 
-    def __init__(
-        self,
-        master,
-        *,
-        textvariable: StringVar | None = None,
-        width: int = 60,
-        radius: int = 10,
-        height: int = 100,
-    ) -> None:
-        super().__init__(master)
-        self.radius = radius
-        self.height = height
-        self.canvas = Canvas(self, highlightthickness=0, bd=0, bg=GITHUB_BG)
-        self.canvas.pack(fill="both", expand=True)
-        font = tkfont.Font()
-        char_width = font.measure("0")
-        w = char_width * width + 20
-        h = height
-        _create_round_rect(self.canvas, 0, 0, w, h, radius, fill=GITHUB_SURFACE, outline="")
-        self.entry = ttk.Entry(
-            self,
-            textvariable=textvariable,
-            style="Rounded.TEntry",
-        )
-        self.entry.place(x=10, y=3, width=w - 20, height=h - 6)
-        self.configure(width=w, height=h)
-        self.canvas.bind("<Configure>", self._resize)
-
-    def _resize(self, event) -> None:
-        w = event.width
-        h = self.height
-        self.canvas.delete("all")
-        self.canvas.configure(width=w, height=h)
-        _create_round_rect(
-            self.canvas, 0, 0, w, h, self.radius, fill=GITHUB_SURFACE, outline=""
-        )
-        self.entry.place(x=10, y=3, width=w - 20, height=h - 6)
-
-    # Proxy common methods to the underlying entry
-    def get(self) -> str:
-        return self.entry.get()
-
-    def insert(self, index, value) -> None:
-        self.entry.insert(index, value)
-
-    def delete(self, first, last=None) -> None:
-        self.entry.delete(first, last)
-
-GITHUB_BG = "#1f2328"
-GITHUB_HEADER_BG = "#161b22"
-GITHUB_SURFACE = "#2d333b"
-GITHUB_TAB_ACTIVE = "#39424a"
-GITHUB_PRIMARY = "#2f81f7"
-GITHUB_FG = "#f0f6fc"
+    def set_enabled(self, enabled: bool) -> None:
+        """Toggle whether clicks fire; a disabled button is drawn dimmed."""
+        self._enabled = enabled
+        self.itemconfig(self.rect, fill=self.bg if enabled else "#30363d")
+        if not enabled:
+            self.itemconfigure(self.hover_rect, state="hidden")
 
 
 class _BaseTab(ttk.Frame):
@@ -164,287 +191,357 @@ class _BaseTab(ttk.Frame):
         self.output_var = StringVar()
 
     # Utility helpers -------------------------------------------------
+    def _open_dialog(self, fn, **kwargs):
+        """Run the modal file dialog *fn*, flushing queued UI events around it.
+
+        Dialogs spin a nested event loop; flushing before and after keeps
+        a running job's status/progress from stalling behind the dialog.
+        """
+        self.update_idletasks()
+        result = fn(**kwargs)
+        self.after_idle(self.winfo_toplevel()._flush_ui)
+        return result
+
     def _clear_common(self) -> None:
         self.input_var.set("")
         self.output_var.set("")
+        clear_document_cache()
+
+
+# Declarative description of the three notebook tabs.  Each field is
+# (label, variable key, browse kind); GenericTab turns a spec into the
+# grid layout the hand-written tab classes used to duplicate.
+TAB_SPECS = [
+    {
+        "name": "Split",
+        "backend": "splitter",
+        "fields": [
+            ("Input PDF", "input", "open_pdf"),
+            ("Output folder", "output", "dir"),
+        ],
+        "action": ("Split PDF", "split"),
+    },
+    {
+        "name": "Split chosen pages",
+        "backend": "splitter",
+        "fields": [
+            ("Input PDF", "input", "open_pdf"),
+            ("Output folder", "output", "dir"),
+            ("Page selections", "pages", None),
+        ],
+        "action": ("Split pages", "split_chosen"),
+    },
+    {
+        "name": "Merge",
+        "backend": "merger",
+        "fields": [
+            ("PDFs to merge", "input", "open_pdfs"),
+            ("Output PDF", "output", "save_pdf"),
+        ],
+        "action": ("Merge PDFs", "merge"),
+    },
+]
+
+_BROWSE_LABELS = {"open_pdf": "Browse…", "open_pdfs": "Browse…", "dir": "Choose…", "save_pdf": "Save As…"}
+
+
+class _CanvasButton:
+    """A rounded button drawn as a tagged item group on a shared canvas."""
+
+    _seq = 0
 
-    def _setup_responsive_buttons(self, frame: ttk.Frame, primary, secondary) -> None:
-        self._btn_frame = frame
-        self._primary_btn = primary
-        self._secondary_btn = secondary
-        frame.bind("<Configure>", self._on_btn_frame_resize)
-
-    def _on_btn_frame_resize(self, event) -> None:
-        width = event.width
-        for child in self._btn_frame.winfo_children():
-            child.grid_forget()
-        if width < 200:
-            self._primary_btn.grid(row=0, column=0, pady=2, sticky="we")
-            self._secondary_btn.grid(row=1, column=0, pady=2, sticky="we")
-        else:
-            self._primary_btn.grid(row=0, column=0, padx=4)
-            self._secondary_btn.grid(row=0, column=1, padx=4)
-
-
-class SplitTab(_BaseTab):
-    """Tab for splitting every page of a PDF into separate files."""
-
-    def __init__(self, master: ttk.Notebook, splitter: PdfSplitter) -> None:
-        super().__init__(master)
-        self.splitter = splitter
-        self._build_widgets()
-
-    # GUI construction ------------------------------------------------
-    def _build_widgets(self) -> None:
-        ttk.Label(self, text="Input PDF:").grid(row=0, column=0, sticky="w")
-        RoundedEntry(self, textvariable=self.input_var, width=60).grid(
-            row=0, column=1, padx=5, pady=2, sticky="we"
-        )
-        RoundedButton(self, text="Browse…", command=self._browse_input).grid(
-            row=0, column=2, padx=5, pady=2
-        )
-
-        ttk.Label(self, text="Output folder:").grid(row=1, column=0, sticky="w")
-        RoundedEntry(self, textvariable=self.output_var, width=60).grid(
-            row=1, column=1, padx=5, pady=2, sticky="we"
-        )
-        RoundedButton(self, text="Choose…", command=self._browse_output).grid(
-            row=1, column=2, padx=5, pady=2
-        )
-
-        btn_frame = ttk.Frame(self)
-        btn_frame.grid(row=2, column=0, columnspan=3, pady=8, sticky="ew")
-        split_btn = RoundedButton(
-            btn_frame,
-            text="Split PDF",
-            command=self._do_split,
-            width=15,
-            bg=GITHUB_PRIMARY,
-            fg="white",
-            active_bg="#1b6ac9",
-        )
-        clear_btn = RoundedButton(
-            btn_frame, text="Clear", command=self._clear_common, width=10
-        )
-        split_btn.grid(row=0, column=0, padx=4)
-        clear_btn.grid(row=0, column=1, padx=4)
-        self._setup_responsive_buttons(btn_frame, split_btn, clear_btn)
-        self.grid_rowconfigure(self.grid_size()[1], weight=1)
-        self.columnconfigure(1, weight=0)
-
-    # Widget callbacks ------------------------------------------------
-    def _browse_input(self) -> None:
-        path = filedialog.askopenfilename(
-            title="Select a PDF", filetypes=[("PDF files", "*.pdf")]
+    def __init__(
+        self,
+        canvas: Canvas,
+        text: str,
+        command,
+        *,
+        width: int | None = None,
+        bg: str = GITHUB_SURFACE,
+        fg: str = GITHUB_FG,
+        active_bg: str = "#444c56",
+        radius: int = 10,
+    ) -> None:
+        _CanvasButton._seq += 1
+        self.canvas = canvas
+        self.command = command
+        self.bg = bg
+        self.enabled = True
+        self.tag = f"cbtn{_CanvasButton._seq}"
+        self._bg_tag = f"{self.tag}b"
+        self._hover_tag = f"{self.tag}h"
+        font, char_width, line_height = _font_metrics()
+        self.w = (width or len(text)) * char_width + 20
+        self.h = line_height + 10
+        _create_round_rect(canvas, 0, 0, self.w, self.h, radius, fill=bg, tag=(self.tag, self._bg_tag))
+        _create_round_rect(canvas, 0, 0, self.w, self.h, radius, fill=active_bg, tag=(self.tag, self._hover_tag))
+        canvas.itemconfigure(self._hover_tag, state="hidden")
+        canvas.create_text(self.w / 2, self.h / 2, text=text, fill=fg, font=font, tags=self.tag)
+        canvas.tag_bind(self.tag, "<Button-1>", lambda e: self.enabled and self.command())
+        canvas.tag_bind(
+            self.tag,
+            "<Enter>",
+            lambda e: self.enabled and canvas.itemconfigure(self._hover_tag, state="normal"),
         )
-        if not path:
-            return
-        self.input_var.set(path)
-        base = os.path.splitext(os.path.basename(path))[0]
-        self.output_var.set(os.path.join(os.path.dirname(path), f"{base}_pages"))
+        canvas.tag_bind(self.tag, "<Leave>", lambda e: canvas.itemconfigure(self._hover_tag, state="hidden"))
+        self.x = 0
+        self.y = 0
 
-    def _browse_output(self) -> None:
-        directory = filedialog.askdirectory(title="Select output folder")
-        if directory:
-            self.output_var.set(directory)
+    def move_to(self, x: int, y: int) -> None:
+        # The whole group translates with one canvas.move on the tag.
+        if (x, y) != (self.x, self.y):
+            self.canvas.move(self.tag, x - self.x, y - self.y)
+            self.x, self.y = x, y
 
-    def _do_split(self) -> None:
-        self.splitter.split(self.input_var.get().strip(), self.output_var.get().strip())
+    def set_enabled(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self.canvas.itemconfigure(self._bg_tag, fill=self.bg if enabled else "#30363d")
+        if not enabled:
+            self.canvas.itemconfigure(self._hover_tag, state="hidden")
 
 
-class SplitChosenTab(_BaseTab):
-    """Tab for splitting PDFs according to custom page selections."""
+class GenericTab(_BaseTab):
+    """A notebook tab whose widgets are generated from a spec dict."""
 
-    def __init__(self, master: ttk.Notebook, splitter: PdfSplitter) -> None:
+    def __init__(self, master: ttk.Notebook, spec: dict, backend) -> None:
         super().__init__(master)
-        self.splitter = splitter
-        self.pages_var = StringVar()
+        self.spec = spec
+        self.backend = backend
+        self.vars = {"input": self.input_var, "output": self.output_var}
+        self.entries: dict[str, ttk.Entry] = {}
+        self._paths: tuple[str, ...] = ()
+        self._paths_summary = ""
         self._build_widgets()
 
+    # GUI construction ------------------------------------------------
+    # One canvas per tab draws every rounded shape; the only child
+    # widgets are native ttk entries placed on top of their backgrounds.
     def _build_widgets(self) -> None:
-        ttk.Label(self, text="Input PDF:").grid(row=0, column=0, sticky="w")
-        RoundedEntry(self, textvariable=self.input_var, width=60).grid(
-            row=0, column=1, padx=5, pady=2, sticky="we"
-        )
-        RoundedButton(self, text="Browse…", command=self._browse_input).grid(
-            row=0, column=2, padx=5, pady=2
-        )
-
-        ttk.Label(self, text="Output folder:").grid(row=1, column=0, sticky="w")
-        RoundedEntry(self, textvariable=self.output_var, width=60).grid(
-            row=1, column=1, padx=5, pady=2, sticky="we"
-        )
-        RoundedButton(self, text="Choose…", command=self._browse_output).grid(
-            row=1, column=2, padx=5, pady=2
-        )
-
-        ttk.Label(self, text="Page selections:").grid(row=2, column=0, sticky="w")
-        RoundedEntry(self, textvariable=self.pages_var, width=60).grid(
-            row=2, column=1, padx=5, pady=2, sticky="we"
-        )
-
-        btn_frame = ttk.Frame(self)
-        btn_frame.grid(row=3, column=0, columnspan=3, pady=8, sticky="ew")
-        split_btn = RoundedButton(
-            btn_frame,
-            text="Split pages",
-            command=self._do_split,
+        font, _, line_height = _font_metrics()
+        self._entry_h = line_height + 10
+        self.canvas = Canvas(self, highlightthickness=0, bd=0, bg=GITHUB_BG)
+        self.canvas.pack(fill="both", expand=True)
+        self._rows = []
+        for label, key, browse in self.spec["fields"]:
+            if key not in self.vars:
+                self.vars[key] = StringVar()
+            label_item = self.canvas.create_text(
+                0, 0, text=f"{label}:", fill=GITHUB_FG, font=font, anchor="w"
+            )
+            bg_tag = f"ebg_{key}"
+            _create_round_rect(
+                self.canvas, 0, 0, 200, self._entry_h, 10, fill=GITHUB_SURFACE, tag=bg_tag
+            )
+            entry = ttk.Entry(self.canvas, style="Rounded.TEntry")
+            self._bind_var(self.vars[key], entry)
+            self.entries[key] = entry
+            button = None
+            if browse:
+                button = _CanvasButton(
+                    self.canvas,
+                    _BROWSE_LABELS[browse],
+                    lambda kind=browse: self._browse(kind),
+                )
+            self._rows.append((label_item, bg_tag, entry, button))
+        self._action_btn = _CanvasButton(
+            self.canvas,
+            self.spec["action"][0],
+            self._do_action,
             width=15,
             bg=GITHUB_PRIMARY,
             fg="white",
             active_bg="#1b6ac9",
         )
-        clear_btn = RoundedButton(btn_frame, text="Clear", command=self._clear_all, width=10)
-        split_btn.grid(row=0, column=0, padx=4)
-        clear_btn.grid(row=0, column=1, padx=4)
-        self._setup_responsive_buttons(btn_frame, split_btn, clear_btn)
-        self.grid_rowconfigure(self.grid_size()[1], weight=1)
-        self.columnconfigure(1, weight=0)
-
-    # Callbacks -------------------------------------------------------
-    def _browse_input(self) -> None:
-        path = filedialog.askopenfilename(
-            title="Select a PDF", filetypes=[("PDF files", "*.pdf")]
-        )
-        if not path:
-            return
-        self.input_var.set(path)
-        base = os.path.splitext(os.path.basename(path))[0]
-        self.output_var.set(os.path.join(os.path.dirname(path), f"{base}_pages"))
-
-    def _browse_output(self) -> None:
-        directory = filedialog.askdirectory(title="Select output folder")
-        if directory:
-            self.output_var.set(directory)
-
-    def _do_split(self) -> None:
-        self.splitter.split_chosen_pages(
-            self.input_var.get().strip(),
-            self.output_var.get().strip(),
-            self.pages_var.get().strip(),
+        self._clear_btn = _CanvasButton(self.canvas, "Clear", self._clear_all, width=10)
+        self._resize_after: str | None = None
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
+
+    @staticmethod
+    def _bind_var(var: StringVar, entry: ttk.Entry) -> None:
+        # One-way sync: programmatic var.set calls update the entry, but
+        # keystrokes never write back through a Tcl variable trace.
+        def write(*_args) -> None:
+            value = var.get()
+            if value != entry.get():
+                entry.delete(0, "end")
+                entry.insert(0, value)
+
+        var.trace_add("write", write)
+
+    def _on_canvas_resize(self, event) -> None:
+        if self._resize_after is not None:
+            self.canvas.after_cancel(self._resize_after)
+        self._resize_after = self.canvas.after(16, self._layout, event.width)
+
+    def _layout(self, width: int) -> None:
+        """Reposition every shape for *width*; items move, none are recreated."""
+        self._resize_after = None
+        canvas = self.canvas
+        _, char_width, _ = _font_metrics()
+        pad = 10
+        label_w = char_width * 15
+        entry_h = self._entry_h
+        y = pad
+        for label_item, bg_tag, entry, button in self._rows:
+            canvas.coords(label_item, pad, y + entry_h // 2)
+            x1 = pad + label_w
+            x2 = max(x1 + 60, width - pad - (button.w + 10 if button else 0))
+            boxes = _round_rect_geometry(x1, y, x2, y + entry_h, 10)
+            for item, box in zip(canvas.find_withtag(bg_tag), boxes):
+                canvas.coords(item, *box)
+            entry.place(x=x1 + 10, y=y + 3, width=x2 - x1 - 20, height=entry_h - 6)
+            if button is not None:
+                button.move_to(x2 + 10, y)
+            y += entry_h + 10
+        y += 8
+        if width < 360:
+            self._action_btn.move_to(pad, y)
+            self._clear_btn.move_to(pad, y + self._action_btn.h + 6)
+        else:
+            self._action_btn.move_to(pad, y)
+            self._clear_btn.move_to(pad + self._action_btn.w + 8, y)
+
+    # Widget callbacks ------------------------------------------------
+    def _browse(self, kind: str) -> None:
+        if kind == "open_pdf":
+            path = self._open_dialog(
+                filedialog.askopenfilename,
+                title="Select a PDF",
+                filetypes=[("PDF files", "*.pdf")],
+            )
+            if not path:
+                return
+            self.input_var.set(path)
+            base = os.path.splitext(os.path.basename(path))[0]
+            self.output_var.set(os.path.join(os.path.dirname(path), f"{base}_pages"))
+        elif kind == "open_pdfs":
+            paths = self._open_dialog(
+                filedialog.askopenfilenames,
+                title="Select PDF files",
+                filetypes=[("PDF files", "*.pdf")],
+            )
+            if not paths:
+                return
+            # Only a short summary goes into the Tcl variable; the real
+            # paths stay in this tuple and are handed to merge() as-is,
+            # so nothing is joined, re-split, or trace-fired per path.
+            self._paths = tuple(paths)
+            self._paths_summary = f"{len(paths)} files selected"
+            self.input_var.set(self._paths_summary)
+            self.output_var.set(os.path.join(os.path.dirname(paths[0]), "merged.pdf"))
+        elif kind == "dir":
+            directory = self._open_dialog(filedialog.askdirectory, title="Select output folder")
+            if directory:
+                self.output_var.set(directory)
+        elif kind == "save_pdf":
+            path = self._open_dialog(
+                filedialog.asksaveasfilename,
+                title="Save merged PDF as",
+                defaultextension=".pdf",
+                filetypes=[("PDF files", "*.pdf")],
+            )
+            if path:
+                self.output_var.set(path)
+
+    def _do_action(self) -> None:
+        action = self.spec["action"][1]
+        in_value = self.entries["input"].get().strip()
+        out_value = self.entries["output"].get().strip()
+        if action == "split":
+            call = (self.backend.split, in_value, out_value)
+        elif action == "split_chosen":
+            call = (
+                self.backend.split_chosen_pages,
+                in_value,
+                out_value,
+                self.entries["pages"].get().strip(),
+            )
+        else:
+            # An edited entry supersedes the browsed selection: the summary
+            # text is what _browse wrote, so any other content means the
+            # user typed paths by hand and the tuple is stale.
+            if self._paths and in_value != self._paths_summary:
+                self._paths = ()
+                self._paths_summary = ""
+            call = (self.backend.merge, self._paths or in_value, out_value)
+        app = self.winfo_toplevel()
+        # One shared worker keeps jobs serialized; the button stays off
+        # until the future completes so a job can't be submitted twice.
+        self._action_btn.set_enabled(False)
+        future = app._executor.submit(*call)
+        future.add_done_callback(
+            lambda _f: app.after(0, self._action_btn.set_enabled, True)
         )
 
     def _clear_all(self) -> None:
         self._clear_common()
-        self.pages_var.set("")
-
-
-class MergeTab(_BaseTab):
-    """Tab for merging multiple PDFs into one file."""
+        for key, var in self.vars.items():
+            if key not in ("input", "output"):
+                var.set("")
+        self._paths = ()
+        self._paths_summary = ""
 
-    def __init__(self, master: ttk.Notebook, merger: PdfMerger) -> None:
-        super().__init__(master)
-        self.merger = merger
-        self._build_widgets()
-
-    def _build_widgets(self) -> None:
-        ttk.Label(self, text="PDFs to merge:").grid(row=0, column=0, sticky="w")
-        RoundedEntry(self, textvariable=self.input_var, width=60).grid(
-            row=0, column=1, padx=5, pady=2, sticky="we"
-        )
-        RoundedButton(self, text="Browse…", command=self._browse_input).grid(
-            row=0, column=2, padx=5, pady=2
-        )
-
-        ttk.Label(self, text="Output PDF:").grid(row=1, column=0, sticky="w")
-        RoundedEntry(self, textvariable=self.output_var, width=60).grid(
-            row=1, column=1, padx=5, pady=2, sticky="we"
-        )
-        RoundedButton(self, text="Save As…", command=self._browse_output).grid(
-            row=1, column=2, padx=5, pady=2
-        )
 
-        btn_frame = ttk.Frame(self)
-        btn_frame.grid(row=2, column=0, columnspan=3, pady=8, sticky="ew")
-        merge_btn = RoundedButton(
-            btn_frame,
-            text="Merge PDFs",
-            command=self._do_merge,
-            width=15,
-            bg=GITHUB_PRIMARY,
-            fg="white",
-            active_bg="#1b6ac9",
-        )
-        clear_btn = RoundedButton(btn_frame, text="Clear", command=self._clear_common, width=10)
-        merge_btn.grid(row=0, column=0, padx=4)
-        clear_btn.grid(row=0, column=1, padx=4)
-        self._setup_responsive_buttons(btn_frame, merge_btn, clear_btn)
-        self.grid_rowconfigure(self.grid_size()[1], weight=1)
-        self.columnconfigure(1, weight=0)
-
-    def _browse_input(self) -> None:
-        paths = filedialog.askopenfilenames(
-            title="Select PDF files", filetypes=[("PDF files", "*.pdf")]
-        )
-        if paths:
-            self.input_var.set("; ".join(paths))
-            self.output_var.set(os.path.join(os.path.dirname(paths[0]), "merged.pdf"))
-
-    def _browse_output(self) -> None:
-        path = filedialog.asksaveasfilename(
-            title="Save merged PDF as",
-            defaultextension=".pdf",
-            filetypes=[("PDF files", "*.pdf")],
-        )
-        if path:
-            self.output_var.set(path)
-
-    def _do_merge(self) -> None:
-        self.merger.merge(self.input_var.get().strip(), self.output_var.get().strip())
+# ---------------------------------------------------------------------------
 
 
-# ---------------------------------------------------------------------------
+def _install_styles(style: ttk.Style) -> None:
+    """Apply the application's ttk styling; each call is a Tcl evaluation."""
+    if "clam" in style.theme_names():
+        style.theme_use("clam")
+    style.configure("TFrame", background=GITHUB_BG)
+    style.configure("TLabel", background=GITHUB_BG, foreground=GITHUB_FG)
+    style.configure(
+        "Rounded.TEntry",
+        fieldbackground=GITHUB_SURFACE,
+        foreground=GITHUB_FG,
+        insertcolor=GITHUB_FG,
+        borderwidth=0,
+        relief="flat",
+    )
+    style.configure("TNotebook", background=GITHUB_BG, borderwidth=0)
+    style.configure(
+        "TNotebook.Tab",
+        padding=(12, 8),
+        background=GITHUB_SURFACE,
+        foreground=GITHUB_FG,
+        borderwidth=0,
+    )
+    style.map(
+        "TNotebook.Tab",
+        background=[("selected", GITHUB_TAB_ACTIVE)],
+        padding=[("selected", (12, 8)), ("!selected", (12, 8))],
+    )
+    style.configure("Header.TFrame", background=GITHUB_HEADER_BG)
+    style.configure(
+        "Header.TLabel",
+        background=GITHUB_HEADER_BG,
+        foreground="white",
+        font=("Segoe UI", 12, "bold"),
+    )
+    style.configure(
+        "TProgressbar",
+        background=GITHUB_PRIMARY,
+        troughcolor=GITHUB_SURFACE,
+    )
 
 
 class PdfApp(Tk):
     """Main application window."""
 
+    # ttk styles are process-wide; configure them once even if PdfApp is
+    # instantiated again (tests, embedding).
+    _style_initialized = False
+
     def __init__(self) -> None:
         super().__init__()
         self.title(APP_TITLE)
         self.minsize(560, 300)
         self.configure(bg=GITHUB_BG)
 
-        style = ttk.Style(self)
-        if "clam" in style.theme_names():
-            style.theme_use("clam")
-
-        # Base widget styling
-        style.configure("TFrame", background=GITHUB_BG)
-        style.configure("TLabel", background=GITHUB_BG, foreground=GITHUB_FG)
-        style.configure(
-            "Rounded.TEntry",
-            fieldbackground=GITHUB_SURFACE,
-            foreground=GITHUB_FG,
-            insertcolor=GITHUB_FG,
-            borderwidth=0,
-            relief="flat",
-        )
-        style.configure("TNotebook", background=GITHUB_BG, borderwidth=0)
-        style.configure(
-            "TNotebook.Tab",
-            padding=(12, 8),
-            background=GITHUB_SURFACE,
-            foreground=GITHUB_FG,
-            borderwidth=0,
-        )
-        style.map(
-            "TNotebook.Tab",
-            background=[("selected", GITHUB_TAB_ACTIVE)],
-            padding=[("selected", (12, 8)), ("!selected", (12, 8))],
-        )
-        style.configure("Header.TFrame", background=GITHUB_HEADER_BG)
-        style.configure(
-            "Header.TLabel",
-            background=GITHUB_HEADER_BG,
-            foreground="white",
-            font=("Segoe UI", 12, "bold"),
-        )
-        style.configure(
-            "TProgressbar",
-            background=GITHUB_PRIMARY,
-            troughcolor=GITHUB_SURFACE,
-        )
+        if not PdfApp._style_initialized:
+            PdfApp._style_initialized = True
+            _install_styles(ttk.Style(self))
 
         # Header bar
         header = ttk.Frame(self, style="Header.TFrame", height=40)
@@ -453,41 +550,145 @@ class PdfApp(Tk):
             side="left", padx=10, pady=10
         )
 
+        self._last_ui = 0.0
+        self._last_status = ""
+        self._progress_max = -1
+        # Progress ticks arrive once per page; cap Tk writes at ~60 Hz so
+        # fast jobs don't spend their time marshalling Tcl strings.
+        self._last_progress_ts = 0.0
+        self._progress_min_interval = 1 / 60
+        self._events: queue.Queue = queue.Queue()
+        self._redraw_scheduled = False
+        self._resize_after: str | None = None
+        # All PDF work funnels through one worker thread so the Tk loop
+        # never blocks and two jobs can't run concurrently.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._cancel_event = threading.Event()
         self.status_var = StringVar()
         self.progress = ttk.Progressbar(self, orient="horizontal", mode="determinate")
-        self.progress.grid(row=2, column=0, columnspan=3, pady=(8, 2), sticky="we")
-        self.status_label = ttk.Label(self, textvariable=self.status_var)
+        self.progress.grid(row=2, column=0, columnspan=2, pady=(8, 2), sticky="we")
+        RoundedButton(self, text="Cancel", command=self._cancel_event.set, width=8).grid(
+            row=2, column=2, padx=6, pady=(8, 2)
+        )
+        # A generous fixed wraplength keeps long "Done" messages wrapping
+        # without recomputing text layout on every window resize.
+        self.status_label = ttk.Label(self, textvariable=self.status_var, wraplength=2000)
         self.status_label.grid(row=3, column=0, columnspan=3, sticky="we")
 
         # Set up backend objects with callbacks
         splitter = PdfSplitter(self._update_status, self._update_progress)
         merger = PdfMerger(self._update_status, self._update_progress)
+        splitter.cancel_event = self._cancel_event
+        merger.cancel_event = self._cancel_event
 
         notebook = ttk.Notebook(self)
         notebook.grid(row=1, column=0, columnspan=3, sticky="nsew")
-        notebook.add(SplitTab(notebook, splitter), text="Split")
-        notebook.add(SplitChosenTab(notebook, splitter), text="Split chosen pages")
-        notebook.add(MergeTab(notebook, merger), text="Merge")
+        backends = {"splitter": splitter, "merger": merger}
+        # Tabs are built on first selection; startup only pays for empty
+        # placeholder frames plus the one tab actually shown.
+        self._notebook = notebook
+        self._tab_factories: dict[str, tuple[dict, object]] = {}
+        for spec in TAB_SPECS:
+            placeholder = ttk.Frame(notebook)
+            notebook.add(placeholder, text=spec["name"])
+            self._tab_factories[str(placeholder)] = (spec, backends[spec["backend"]])
+        notebook.bind("<<NotebookTabChanged>>", self._build_selected_tab)
+        self._build_selected_tab()
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
         self.bind("<Configure>", self._on_resize)
 
+        # Error dialogs raised from worker threads must run on this thread.
+        set_dispatcher(lambda fn: self.after(0, fn))
+
+    def _build_selected_tab(self, _event=None) -> None:
+        notebook = self._notebook
+        current = notebook.select()
+        entry = self._tab_factories.pop(current, None)
+        if entry is None:
+            return
+        spec, backend = entry
+        index = notebook.index(current)
+        tab = GenericTab(notebook, spec, backend)
+        notebook.forget(current)
+        notebook.insert(index, tab, text=spec["name"])
+        notebook.select(index)
+
     # Backend callbacks -----------------------------------------------
+    # The splitter/merger run on worker threads, so these enqueue updates
+    # and schedule one idle-time flush on the Tk thread.  Updates that
+    # arrive faster than Tk can paint simply pile into the pending queue
+    # and are applied in a single flush; no timer runs while idle.
     def _update_status(self, msg: str) -> None:
-        self.status_var.set(msg)
-        self.update_idletasks()
+        now = time.monotonic()
+        if msg.endswith("...") and now - self._last_ui < 0.05:
+            return
+        self._last_ui = now
+        self._events.put(("status", msg))
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        # One after_idle per burst; the flag is reset by _flush_ui so a
+        # second update arriving before the flush does not schedule again.
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.after_idle(self._flush_ui)
+
+    def _flush_ui(self) -> None:
+        self._redraw_scheduled = False
+        # Intermediate values are superseded the moment a newer one is
+        # queued, so only the freshest status and progress touch Tk.
+        last_status = None
+        last_progress = None
+        try:
+            while True:
+                event = self._events.get_nowait()
+                if event[0] == "status":
+                    last_status = event[1]
+                else:
+                    last_progress = (event[1], event[2])
+        except queue.Empty:
+            pass
+        if last_status is not None:
+            self._apply_status(last_status)
+        if last_progress is not None:
+            self._apply_progress(*last_progress)
+
+    def _apply_status(self, msg: str) -> None:
+        # Setting a StringVar fires traces and a label redraw even when the
+        # text is identical, so skip writes that would change nothing.
+        if msg != self._last_status:
+            self._last_status = msg
+            self.status_var.set(msg)
 
     def _update_progress(self, current: int, total: int) -> None:
-        self.progress["maximum"] = total
+        now = time.monotonic()
+        if current != total and now - self._last_progress_ts < self._progress_min_interval:
+            return
+        self._last_progress_ts = now
+        self._events.put(("progress", current, total))
+        self._schedule_flush()
+
+    def _apply_progress(self, current: int, total: int) -> None:
+        # total only changes when a new job starts; skip the rewrite.
+        if total != self._progress_max:
+            self._progress_max = total
+            self.progress["maximum"] = total
         self.progress["value"] = current
-        self.update_idletasks()
 
     def _on_resize(self, event) -> None:
-        width = event.width - 20
+        # Configure fires per pixel of a window drag; keep cancelling the
+        # pending timer so only the final size reconfigures the widgets.
+        if self._resize_after is not None:
+            self.after_cancel(self._resize_after)
+        self._resize_after = self.after(30, self._apply_resize, event.width)
+
+    def _apply_resize(self, width: int) -> None:
+        self._resize_after = None
+        width -= 20
         if width > 0:
             self.progress.configure(length=width)
-            self.status_label.configure(wraplength=width)
 
 
 def main() -> None: